@@ -3,14 +3,25 @@ from __future__ import annotations
 import argparse
 import getpass
 import logging
+import os
 from pathlib import Path
 from typing import Sequence
 
 from rich.logging import RichHandler
 from rich.traceback import install
 
-from .client import PBaseClient
-from .scraper import PBaseScraper
+from .client import DEFAULT_POOL_MAXSIZE, PBaseClient
+from .scraper import DEFAULT_MAX_WORKERS, GALLERY_PREFETCH_DEPTH, PBaseScraper
+
+
+def _worker_count(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return count
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -51,6 +62,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.5,
         help="Seconds to wait between HTTP requests (default: 0.5).",
     )
+    parser.add_argument(
+        "--workers",
+        type=_worker_count,
+        # argparse runs string defaults through `type`, so a bad PBASE_WORKERS is reported
+        # as a normal usage error at parse time rather than crashing on import.
+        default=os.environ.get("PBASE_WORKERS", str(DEFAULT_MAX_WORKERS)),
+        help=(
+            "Number of images resolved concurrently "
+            f"(default: $PBASE_WORKERS or {DEFAULT_MAX_WORKERS})."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -94,10 +116,12 @@ def main(argv: Sequence[str] | None = None) -> None:
         password=password,
         base_url=args.base_url,
         request_delay=args.delay,
+        # One pooled connection per image worker, prefetch thread and the main thread.
+        pool_maxsize=max(DEFAULT_POOL_MAXSIZE, args.workers + GALLERY_PREFETCH_DEPTH + 1),
     )
     client.login()
 
-    scraper = PBaseScraper(client, output_dir=output_dir)
+    scraper = PBaseScraper(client, output_dir=output_dir, max_workers=args.workers)
     scraper.scrape(args.start)
 
 
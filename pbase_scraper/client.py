@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
-from typing import Iterable, Optional
-from urllib.parse import urljoin, urlparse
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+from urllib.parse import ParseResult, urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +22,11 @@ DEFAULT_USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/119.0 Safari/537.36"
 )
+# libxml2-backed parsing is far faster than the pure-Python html.parser on large galleries.
+HTML_PARSER = "lxml"
+# Floor for the connection pool; callers running more threads pass a larger pool_maxsize
+# so urllib3 never discards connections with "Connection pool is full".
+DEFAULT_POOL_MAXSIZE = 32
 
 
 class PBaseLoginError(RuntimeError):
@@ -26,6 +35,12 @@ class PBaseLoginError(RuntimeError):
 
 def _normalize_url(url: str, base_url: str) -> str:
     """Return an absolute URL anchored at the configured base."""
+    return _normalize_url_parts(url, base_url)[0]
+
+
+@lru_cache(maxsize=65536)
+def _normalize_url_parts(url: str, base_url: str) -> Tuple[str, ParseResult]:
+    """Like ``_normalize_url`` but also return the parsed form for callers that need it."""
     if not url:
         raise ValueError("Empty URL provided.")
     resolved = urljoin(base_url if base_url.endswith("/") else f"{base_url}/", url)
@@ -33,7 +48,17 @@ def _normalize_url(url: str, base_url: str) -> str:
     # PBase sometimes points to //www.pbase.com/..., so normalize the scheme.
     if not parts.scheme:
         resolved = "https:" + resolved
-    return resolved
+        parts = parts._replace(scheme="https")
+    return resolved, parts
+
+
+def parse_html(response: requests.Response) -> BeautifulSoup:
+    """Parse a response body, honouring a charset declared in the Content-Type header."""
+    content_type = (response.headers.get("Content-Type") or "").lower()
+    # Without a declared charset, hand lxml the raw bytes so it reads any <meta> charset
+    # itself instead of requests guessing; an explicit header charset always wins.
+    encoding = response.encoding if "charset" in content_type else None
+    return BeautifulSoup(response.content, HTML_PARSER, from_encoding=encoding)
 
 
 @dataclass
@@ -45,12 +70,22 @@ class PBaseClient:
     base_url: str = DEFAULT_BASE_URL
     request_delay: float = 0.0
     session: requests.Session = None  # type: ignore[assignment]
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
 
     def __post_init__(self) -> None:
         if not self.session:
             self.session = requests.Session()
         self.session.headers.setdefault("User-Agent", DEFAULT_USER_AGENT)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._last_request_ts: float = 0.0
+        # Worker threads share the client, so throttling must be serialized.
+        self._delay_lock = threading.Lock()
 
     def login(self) -> None:
         """Authenticate against the PBase login form."""
@@ -58,7 +93,7 @@ class PBaseClient:
         logger.debug("Fetching login form: %s", login_url)
         response = self.session.get(login_url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = parse_html(response)
 
         form = self._locate_login_form(soup)
         if not form:
@@ -88,18 +123,27 @@ class PBaseClient:
         response.raise_for_status()
         return response
 
+    def head(self, url: str, *, headers: Optional[dict] = None) -> requests.Response:
+        """HEAD wrapper with the same throttling and URL handling as ``get``."""
+        full_url = _normalize_url(url, self.base_url) if not url.startswith(("http://", "https://")) else url
+        self._respect_delay()
+        logger.debug("HEAD %s", full_url)
+        response = self.session.head(full_url, allow_redirects=True, headers=headers)
+        response.raise_for_status()
+        return response
+
     def get_soup(self, url: str) -> BeautifulSoup:
         """Retrieve a page and parse into BeautifulSoup."""
         response = self.get(url)
-        return BeautifulSoup(response.text, "html.parser")
+        return parse_html(response)
 
-    def iter_links(self, soup: BeautifulSoup) -> Iterable[str]:
-        """Yield absolute hrefs for all anchor tags in the soup."""
+    def iter_links(self, soup: BeautifulSoup) -> Iterable[Tuple[str, ParseResult]]:
+        """Yield ``(absolute_href, parsed)`` for all anchor tags in the soup."""
         for anchor in soup.find_all("a"):
             href = (anchor.get("href") or "").strip()
             if not href or href.startswith("#") or href.lower().startswith("javascript:"):
                 continue
-            yield _normalize_url(href, self.base_url)
+            yield _normalize_url_parts(href, self.base_url)
 
     def _locate_login_form(self, soup: BeautifulSoup) -> Optional[dict]:
         """Return dict representation of the login form."""
@@ -164,7 +208,8 @@ class PBaseClient:
     def _respect_delay(self) -> None:
         if self.request_delay <= 0:
             return
-        delta = time.monotonic() - self._last_request_ts
-        if delta < self.request_delay:
-            time.sleep(self.request_delay - delta)
-        self._last_request_ts = time.monotonic()
+        with self._delay_lock:
+            delta = time.monotonic() - self._last_request_ts
+            if delta < self.request_delay:
+                time.sleep(self.request_delay - delta)
+            self._last_request_ts = time.monotonic()
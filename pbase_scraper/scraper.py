@@ -2,19 +2,78 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Sequence, Set, Tuple
-from urllib.parse import urlparse, urlunparse
+from typing import BinaryIO, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import ParseResult, urlparse, urlunparse
 
+import requests
+import xxhash
 from bs4 import BeautifulSoup
 
-from .client import PBaseClient
+from .client import PBaseClient, parse_html
+from .state import ScrapeState
 
 logger = logging.getLogger(__name__)
 
 SIZE_ORDER: Sequence[str] = ("original", "large", "medium", "small")
+DEFAULT_MAX_WORKERS = 8
+GALLERY_PREFETCH_DEPTH = 2
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+WRITE_QUEUE_SIZE = 64
+WRITE_QUEUE_TIMEOUT = 1.0
+# The same hrefs and labels recur on every page, so the pure URL/label helpers are memoized.
+_CACHE_SIZE = 65536
+
+_EXCLUDED_SRC_TOKENS = ("m_pbase", "logo", "pixel.gif", "blank.gif")
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+_BINARY_EXTENSIONS = _IMAGE_EXTENSIONS + (".gif",)
+# Hosts that serve image files directly rather than HTML image pages.
+_IMAGE_HOSTS = ("i.pbase.com",)
+
+# Second path segments that are account pages rather than galleries.
+_FORBIDDEN_SEGMENTS = frozenset(
+    {
+        "forum",
+        "search",
+        "logout",
+        "login",
+        "profile",
+        "guestbook",
+        "help",
+        "recent",
+        "slideshow",
+        "upload",
+        "edit",
+        "view",
+        "galleries",
+        "statistics",
+        "usage",
+        "payment",
+        "popular",
+        "random",
+    }
+)
+
+_RE_SAFE = re.compile(r"[^\w.\-() ]+")
+_RE_UNSAFE_RUN = re.compile("\x00+")
+_RE_MULTISLASH = re.compile(r"/{2,}")
+# PBase boilerplate in page titles: "photo - <user> photos at pbase.com" and "| / - pbase.com ..." tails.
+_RE_LABEL = re.compile(
+    r"\s*photo\s*-\s*[^|]*photos at pbase\.com|\s*[|-]\s*pbase\.com.*$",
+    re.IGNORECASE,
+)
+_RE_STYLE_W = re.compile(r"width:\s*(\d+)")
+_RE_STYLE_H = re.compile(r"height:\s*(\d+)")
+_RE_SIZES = re.compile(r"\b(%s)\b" % "|".join(SIZE_ORDER))
 
 
 @dataclass
@@ -26,37 +85,132 @@ class ImageDownload:
     referer: str
 
 
+@dataclass
+class _WriteChunk:
+    """A block of downloaded bytes queued for the writer thread."""
+
+    path: Path
+    data: bytes
+    last: bool = False
+    # Set on the final chunk of a complete download; recorded once the file is closed.
+    page_url: Optional[str] = None
+
+
 class PBaseScraper:
     """Scrape galleries and download original-sized images."""
 
-    def __init__(self, client: PBaseClient, *, output_dir: Path) -> None:
+    def __init__(
+        self,
+        client: PBaseClient,
+        *,
+        output_dir: Path,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
         self.client = client
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.visited_galleries: Set[str] = set()
-        self.visited_images: Set[str] = set()
-        self._filename_cache: Set[str] = set()
+        self.max_workers = max(1, max_workers)
+        self._username_lc = client.username.lower()
+        # Visited sets hold 64-bit fingerprints (see _fp) rather than full URL strings.
+        self.visited_galleries: Set[int] = set()
+        # Seeded from the resume state when scrape() starts; galleries are always re-walked
+        # so a resumed run still reaches unfinished branches.
+        self.visited_images: Set[int] = set()
+        # Seeded from the directory listing so collisions resolve without a stat() per attempt.
+        self._filename_cache: Set[str] = {path.name for path in self.output_dir.iterdir()}
+        self._stem_counters: Dict[str, int] = {}
+        # Bounded LRU of resolved candidate URLs; most keys are unique per image.
+        self._binary_url_cache: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        # Guards visited_images, _filename_cache and _binary_url_cache, which image workers share.
+        self._state_lock = threading.Lock()
+        # Executors, the writer thread and the state database live for one scrape() call.
+        self._state: Optional[ScrapeState] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._futures: List[Future] = []
+        self._write_q: Optional["queue.Queue[Optional[_WriteChunk]]"] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_error: Optional[Exception] = None
 
     def scrape(self, start_paths: Optional[Sequence[str]] = None) -> None:
         """Scrape galleries starting from the provided paths."""
         paths = list(start_paths) if start_paths else [f"{self.client.username}/root"]
-        for path in paths:
-            gallery_url = self._prepare_gallery_url(path)
-            self._scrape_gallery(gallery_url, parent_title=None)
-
-    def _scrape_gallery(self, url: str, parent_title: Optional[str] = None) -> None:
+        # Walk galleries from an explicit work queue so parsed pages are freed before descending.
+        pending: Deque[Tuple[str, Optional[str]]] = deque(
+            (self._prepare_gallery_url(path), None) for path in paths
+        )
+        prefetched: Dict[str, Future] = {}
+        self._start_workers()
+        failed = True
+        try:
+            while pending:
+                url, parent_title = pending.popleft()
+                self._prefetch_galleries(pending, prefetched)
+                pending.extend(self._scrape_gallery(url, parent_title, prefetched.pop(url, None)))
+            wait(self._futures)
+            for future in self._futures:
+                # Re-raise the first worker failure, matching the sequential behaviour.
+                future.result()
+            failed = False
+        finally:
+            # On errors and Ctrl-C, drop queued work instead of draining the whole backlog.
+            self._stop_workers(cancel=failed)
+        if self._writer_error:
+            raise self._writer_error
+
+    def _start_workers(self) -> None:
+        self._state = ScrapeState(self.output_dir)
+        with self._state_lock:
+            self.visited_images.update(_fp(url) for url in self._state.load_images())
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._futures = []
+        # Kept separate from the image pool so prefetches are not queued behind downloads.
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=GALLERY_PREFETCH_DEPTH)
+        # All file I/O goes through one writer thread; the bounded queue applies backpressure.
+        self._write_q = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_error = None
+        self._writer = threading.Thread(target=self._writer_loop, name="pbase-writer", daemon=True)
+        self._writer.start()
+
+    def _stop_workers(self, *, cancel: bool) -> None:
+        try:
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=cancel)
+            self._pool.shutdown(wait=True, cancel_futures=cancel)
+            if self._put_write(None):
+                self._writer.join()
+        finally:
+            # Always flush the pending resume batch, even if shutdown is interrupted.
+            self._state.close()
+
+    def _prefetch_galleries(
+        self, pending: Deque[Tuple[str, Optional[str]]], prefetched: Dict[str, Future]
+    ) -> None:
+        """Keep the next queued gallery pages downloading while the current one is walked."""
+        for url, _parent_title in islice(pending, GALLERY_PREFETCH_DEPTH):
+            if url not in prefetched and _fp(url) not in self.visited_galleries:
+                prefetched[url] = self._prefetch_pool.submit(self.client.get_soup, url)
+
+    def _scrape_gallery(
+        self,
+        url: str,
+        parent_title: Optional[str] = None,
+        prefetched: Optional[Future] = None,
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Scrape one gallery page and return its unvisited sub-galleries as queue items."""
         normalized = self._normalize_gallery_url(url)
-        if normalized in self.visited_galleries:
+        fingerprint = _fp(normalized)
+        if fingerprint in self.visited_galleries:
             logger.debug("Skipping already visited gallery %s", normalized)
-            return
+            return []
         logger.info("Scraping gallery [bold cyan]%s[/]", normalized)
-        self.visited_galleries.add(normalized)
+        self.visited_galleries.add(fingerprint)
 
-        soup = self.client.get_soup(normalized)
+        soup = prefetched.result() if prefetched else self.client.get_soup(normalized)
         gallery_title = self._determine_gallery_title(soup, normalized, parent_title)
         gallery_title = _clean_label(gallery_title) or gallery_title
 
         image_links, gallery_links = self._extract_gallery_contents(soup)
+        del soup
         logger.debug(
             "Found %d sub-galleries and %d images inside %s",
             len(gallery_links),
@@ -64,19 +218,26 @@ class PBaseScraper:
             normalized,
         )
 
-        for image_link in sorted(image_links):
-            self._scrape_image(image_link, gallery_title)
+        # Queue image work and keep walking; downloads overlap with sub-gallery traversal.
+        self._futures.extend(
+            self._pool.submit(self._scrape_image, link, gallery_title) for link in sorted(image_links)
+        )
 
-        for gallery_link in sorted(gallery_links):
-            self._scrape_gallery(gallery_link, parent_title=gallery_title)
+        return [
+            (gallery_link, gallery_title)
+            for gallery_link in sorted(gallery_links)
+            if _fp(gallery_link) not in self.visited_galleries
+        ]
 
     def _scrape_image(self, url: str, gallery_title: Optional[str]) -> None:
         normalized = self._normalize_image_url(url)
-        if normalized in self.visited_images:
-            logger.debug("Skipping already visited image %s", normalized)
-            return
+        fingerprint = _fp(normalized)
+        with self._state_lock:
+            if fingerprint in self.visited_images:
+                logger.debug("Skipping already visited image %s", normalized)
+                return
+            self.visited_images.add(fingerprint)
         logger.info("Resolving image [magenta]%s[/]", normalized)
-        self.visited_images.add(normalized)
 
         soup = self.client.get_soup(normalized)
         image = self._resolve_best_image(soup, normalized, gallery_title)
@@ -89,27 +250,93 @@ class PBaseScraper:
             logger.info("[yellow]Skipping[/] existing file [bold]%s[/]", destination)
             return
 
-        response = self.client.get(image.url, stream=True, headers={"Referer": image.referer})
+        # Image bytes are already compressed; skip transport encoding on the binary download.
+        headers = {"Referer": image.referer, "Accept-Encoding": "identity"}
+        response = self.client.get(image.url, stream=True, headers=headers)
+        completed = False
         try:
-            with destination.open("wb") as handle:
-                for chunk in response.iter_content(chunk_size=1024 * 32):
-                    if chunk:
-                        handle.write(chunk)
-            logger.info("Saved [bold green]%s[/]", destination)
+            # Read in large blocks and hand them to the writer thread; iter_content keeps
+            # requests' content decoding and exception types for truncated bodies.
+            for data in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                if not data:
+                    continue
+                if not self._put_write(_WriteChunk(destination, data)):
+                    raise RuntimeError(f"Writer thread stopped; aborting download of {destination}")
+            completed = True
         finally:
             response.close()
+            self._put_write(
+                _WriteChunk(destination, b"", last=True, page_url=normalized if completed else None)
+            )
+
+    def _put_write(self, chunk: Optional[_WriteChunk]) -> bool:
+        """Queue a chunk for the writer; return False instead of blocking if the writer is gone."""
+        while self._writer.is_alive():
+            try:
+                self._write_q.put(chunk, timeout=WRITE_QUEUE_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _writer_loop(self) -> None:
+        handles: Dict[Path, BinaryIO] = {}
+        failed: Set[Path] = set()
+        while True:
+            chunk = self._write_q.get()
+            if chunk is None:
+                break
+            if chunk.path in failed:
+                if chunk.last:
+                    failed.discard(chunk.path)
+                continue
+            try:
+                handle = handles.get(chunk.path)
+                if handle is None:
+                    handle = handles[chunk.path] = chunk.path.open("wb")
+                if chunk.data:
+                    handle.write(chunk.data)
+                if not chunk.last:
+                    continue
+                handles.pop(chunk.path).close()
+            except Exception as exc:
+                # Keep draining after any failure so producers and shutdown never block.
+                logger.error("[red]Failed writing[/] %s: %s", chunk.path, exc)
+                self._writer_error = self._writer_error or exc
+                stale = handles.pop(chunk.path, None)
+                # Drop the partial file so a rerun retries it instead of saving a duplicate.
+                with suppress(OSError):
+                    if stale:
+                        stale.close()
+                    chunk.path.unlink(missing_ok=True)
+                if not chunk.last:
+                    failed.add(chunk.path)
+                continue
+            if not chunk.page_url:
+                # The download was interrupted; drop the partial file so a rerun retries it.
+                with suppress(OSError):
+                    chunk.path.unlink(missing_ok=True)
+                continue
+            logger.info("Saved [bold green]%s[/]", chunk.path)
+            try:
+                self._state.add_image(chunk.page_url)
+            except Exception as exc:
+                logger.error("[red]Failed recording[/] %s in resume state: %s", chunk.page_url, exc)
+                self._writer_error = self._writer_error or exc
 
     def _extract_gallery_contents(self, soup: BeautifulSoup) -> Tuple[Set[str], Set[str]]:
         images: Set[str] = set()
         galleries: Set[str] = set()
-        for link in self.client.iter_links(soup):
-            parsed = urlparse(link)
+        for _link, parsed in self.client.iter_links(soup):
             if not parsed.netloc or not parsed.netloc.endswith("pbase.com"):
                 continue
+            # Reuse the parse from iter_links and strip view suffixes once for both the
+            # gallery test and normalization.
+            cleaned_path = _strip_view_suffix(parsed.path)
             if self._is_image_link(parsed):
-                images.add(self._normalize_image_url(link))
-            elif self._is_gallery_link(parsed):
-                galleries.add(self._normalize_gallery_url(link))
+                images.add(_rebuild_page_url(parsed, cleaned_path))
+            elif self._is_gallery_link(cleaned_path):
+                galleries.add(_rebuild_page_url(parsed, cleaned_path))
         return images, galleries
 
     def _resolve_best_image(
@@ -149,37 +376,59 @@ class PBaseScraper:
             href = (anchor.get("href") or "").strip()
             if not href:
                 continue
-            normalized_text = re.sub(r"\s+", " ", text)
-            for size in SIZE_ORDER:
-                if size in normalized_text:
-                    size_links.setdefault(size, urljoin_referer(referer, href))
+            # An anchor can name several sizes ("original size (large)"); register each one.
+            for match in _RE_SIZES.finditer(text):
+                size_links.setdefault(match.group(1), urljoin_referer(referer, href))
+            if len(size_links) == len(SIZE_ORDER):
+                break
         return size_links
 
     def _resolve_binary_url(self, url: str, referer: Optional[str]) -> Optional[str]:
         base = referer or self.client.base_url
         absolute = urljoin_referer(base, url)
+        with self._state_lock:
+            if absolute in self._binary_url_cache:
+                self._binary_url_cache.move_to_end(absolute)
+                return self._binary_url_cache[absolute]
+        resolved = self._fetch_binary_url(absolute, referer)
+        with self._state_lock:
+            self._binary_url_cache[absolute] = resolved
+            if len(self._binary_url_cache) > _CACHE_SIZE:
+                self._binary_url_cache.popitem(last=False)
+        return resolved
+
+    def _fetch_binary_url(self, absolute: str, referer: Optional[str]) -> Optional[str]:
         headers = {"Referer": referer} if referer else None
+        # Size links usually point at HTML pages, where a HEAD would only add a throttled
+        # round trip; probe with HEAD only when the URL looks like a direct image.
+        if _looks_like_binary_url(absolute):
+            try:
+                head = self.client.head(absolute, headers=headers)
+            except requests.RequestException as exc:
+                logger.debug("HEAD %s failed (%s); falling back to GET", absolute, exc)
+            else:
+                if (head.headers.get("Content-Type") or "").lower().startswith("image/"):
+                    return absolute
         response = self.client.get(absolute, stream=True, headers=headers)
         content_type = (response.headers.get("Content-Type") or "").lower()
         if content_type.startswith("image/"):
             response.close()
             return absolute
-        text = response.text
+        soup = parse_html(response)
         response.close()
-        soup = BeautifulSoup(text, "html.parser")
         tag = self._select_display_image(soup)
         if not tag or not tag.get("src"):
             return None
         return urljoin_referer(absolute, tag["src"])
 
     def _select_display_image(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
-        candidates = []
+        best_score, best_img = -1, None
         for img in soup.find_all("img"):
             src = (img.get("src") or "").strip()
             if not src:
                 continue
             src_lower = src.lower()
-            if any(token in src_lower for token in ("m_pbase", "logo", "pixel.gif", "blank.gif")):
+            if any(token in src_lower for token in _EXCLUDED_SRC_TOKENS):
                 continue
             width = _parse_int(img.get("width"))
             height = _parse_int(img.get("height"))
@@ -189,45 +438,42 @@ class PBaseScraper:
                 height = height or style_height
             dimension_score = (width or 0) * (height or 0)
             heuristic_bonus = 0
-            if any(ext in src_lower for ext in (".jpg", ".jpeg", ".png", ".webp")):
+            if any(ext in src_lower for ext in _IMAGE_EXTENSIONS):
                 heuristic_bonus += 10_000_000
             if "/image/" in src_lower:
                 heuristic_bonus += 5_000_000
             score = heuristic_bonus + dimension_score
-            candidates.append((score, img))
-        if not candidates:
-            return None
-        candidates.sort(key=lambda item: item[0], reverse=True)
-        return candidates[0][1]
+            # Strict comparison keeps the earliest image on ties, as the old stable sort did.
+            if score > best_score:
+                best_score, best_img = score, img
+        return best_img
 
     def _output_path(self, directory: Path, filename: str) -> Path:
         safe_name = sanitize_filename(filename)
         safe_name = self._truncate_filename(safe_name)
         candidate = directory / safe_name
-        if not candidate.exists():
-            self._filename_cache.add(candidate.name)
-            return candidate
-        stem = candidate.stem
-        suffix = candidate.suffix
-        counter = 1
-        while True:
-            new_candidate = directory / f"{stem}_{counter}{suffix}"
-            if not new_candidate.exists():
-                self._filename_cache.add(new_candidate.name)
-                return new_candidate
-            counter += 1
+        with self._state_lock:
+            # Names claimed by in-flight downloads may not exist on disk yet.
+            if candidate.name not in self._filename_cache and not candidate.exists():
+                self._filename_cache.add(candidate.name)
+                return candidate
+            stem = candidate.stem
+            suffix = candidate.suffix
+            # Resume numbering where the last collision on this name left off.
+            counter = self._stem_counters.get(candidate.name, 0)
+            while True:
+                counter += 1
+                new_name = f"{stem}_{counter}{suffix}"
+                if new_name not in self._filename_cache:
+                    self._stem_counters[candidate.name] = counter
+                    self._filename_cache.add(new_name)
+                    return directory / new_name
 
     def _normalize_gallery_url(self, url: str) -> str:
-        parsed = urlparse(url)
-        cleaned_path = _strip_view_suffix(parsed.path)
-        normalized = parsed._replace(path=cleaned_path, query="", fragment="")
-        return urlunparse(normalized)
+        return _normalize_page_url(url)
 
     def _normalize_image_url(self, url: str) -> str:
-        parsed = urlparse(url)
-        cleaned_path = _strip_view_suffix(parsed.path)
-        normalized = parsed._replace(path=cleaned_path, query="", fragment="")
-        return urlunparse(normalized)
+        return _normalize_page_url(url)
 
     def _prepare_gallery_url(self, path: str) -> str:
         if path.startswith(("http://", "https://")):
@@ -349,50 +595,64 @@ class PBaseScraper:
         return None
 
     def _is_image_link(self, parsed) -> bool:
-        path = parsed.path.lower()
-        if "/image/" not in path:
-            return False
-        if any(part in path for part in ("/edit", "/delete", "/upload")):
-            return False
-        return True
-
-    def _is_gallery_link(self, parsed) -> bool:
-        path = _strip_view_suffix(parsed.path).strip("/")
-        if not path:
-            return False
-        segments = [seg for seg in path.split("/") if seg]
-        if not segments:
-            return False
-        if segments[0].lower() != self.client.username.lower():
-            return False
-        if "image" in (seg.lower() for seg in segments[1:]):
-            return False
-        forbidden = {
-            "forum",
-            "search",
-            "logout",
-            "login",
-            "profile",
-            "guestbook",
-            "help",
-            "recent",
-            "slideshow",
-            "upload",
-            "edit",
-            "view",
-            "galleries",
-            "statistics",
-            "usage",
-            "payment",
-            "popular",
-            "random",
-        }
-        if len(segments) >= 2 and segments[1].lower() in forbidden:
-            return False
-        # PBase exposes both /user/gallery/name and /user/name structures.
-        return True
+        return _is_image_path(parsed.path)
+
+    def _is_gallery_link(self, cleaned_path: str) -> bool:
+        return _is_gallery_path(cleaned_path, self._username_lc)
+
+
+def _fp(url: str) -> int:
+    """Compact 64-bit fingerprint for visited-set membership; collisions are negligible at this scale."""
+    return xxhash.xxh3_64_intdigest(url.encode("utf-8"))
+
+
+def _looks_like_binary_url(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.path.lower().endswith(_BINARY_EXTENSIONS) or parsed.netloc.lower() in _IMAGE_HOSTS
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
+def _normalize_page_url(url: str) -> str:
+    """Drop query, fragment and view suffixes so each gallery/image page has one key."""
+    parsed = urlparse(url)
+    return _rebuild_page_url(parsed, _strip_view_suffix(parsed.path))
+
+
+def _rebuild_page_url(parsed: ParseResult, cleaned_path: str) -> str:
+    normalized = parsed._replace(path=cleaned_path, query="", fragment="")
+    return urlunparse(normalized)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _is_image_path(path: str) -> bool:
+    path = path.lower()
+    if "/image/" not in path:
+        return False
+    if any(part in path for part in ("/edit", "/delete", "/upload")):
+        return False
+    return True
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _is_gallery_path(path: str, username_lc: str) -> bool:
+    """Expects a path already passed through ``_strip_view_suffix``."""
+    path = path.strip("/")
+    if not path:
+        return False
+    segments = [seg for seg in path.split("/") if seg]
+    if not segments:
+        return False
+    if segments[0].lower() != username_lc:
+        return False
+    if "image" in (seg.lower() for seg in segments[1:]):
+        return False
+    if len(segments) >= 2 and segments[1].lower() in _FORBIDDEN_SEGMENTS:
+        return False
+    # PBase exposes both /user/gallery/name and /user/name structures.
+    return True
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def urljoin_referer(base: str, url: str) -> str:
     from urllib.parse import urljoin
 
@@ -401,12 +661,32 @@ def urljoin_referer(base: str, url: str) -> str:
     return urljoin(base if base.endswith("/") else f"{base}/", url)
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def sanitize_filename(name: str) -> str:
-    safe = re.sub(r"[^\w.\-() ]+", "_", name)
-    safe = re.sub(r"\s+", " ", safe).strip()
+    # Disallowed characters become a NUL marker in one C-level pass; only names that
+    # contained any need the regex to collapse each run into a single "_".
+    safe = name.translate(_SAFE_MAP)
+    if "\x00" in safe:
+        safe = _RE_UNSAFE_RUN.sub("_", safe)
+    # Spaces are the only whitespace left, so split/join collapses and strips them.
+    safe = " ".join(safe.split())
     return safe or "image.jpg"
 
 
+class _SafeCharMap(dict):
+    """``str.translate`` table filled lazily, since the codepoint space is too big to prebuild."""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        # NUL itself is never allowed, so it cannot collide with a real character.
+        mapped = "\x00" if _RE_SAFE.match(char) else char
+        self[codepoint] = mapped
+        return mapped
+
+
+_SAFE_MAP = _SafeCharMap()
+
+
 def _parse_int(value: Optional[str]) -> Optional[int]:
     if not value:
         return None
@@ -419,8 +699,8 @@ def _parse_int(value: Optional[str]) -> Optional[int]:
 def _parse_dimensions_from_style(style: str) -> Tuple[Optional[int], Optional[int]]:
     width = None
     height = None
-    width_match = re.search(r"width:\s*(\d+)", style)
-    height_match = re.search(r"height:\s*(\d+)", style)
+    width_match = _RE_STYLE_W.search(style)
+    height_match = _RE_STYLE_H.search(style)
     if width_match:
         width = _parse_int(width_match.group(1))
     if height_match:
@@ -428,18 +708,21 @@ def _parse_dimensions_from_style(style: str) -> Tuple[Optional[int], Optional[in
     return width, height
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def _clean_label(text: Optional[str]) -> str:
     if not text:
         return ""
     cleaned = str(text).strip()
-    cleaned = re.sub(r"\s*photo\s*-\s*[^|]*photos at pbase\.com", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*\|\s*pbase\.com.*$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*-\s*pbase\.com.*$", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(r"\s*\|\s*$", "", cleaned)
+    cleaned = _RE_LABEL.sub("", cleaned)
+    # A dangling separator left by the boilerplate is stripped without another regex pass.
+    cleaned = cleaned.rstrip()
+    if cleaned.endswith("|"):
+        cleaned = cleaned[:-1].rstrip()
     cleaned = cleaned.strip(" -–—")
     return cleaned
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def _strip_view_suffix(path: str) -> str:
     """Normalize gallery paths that embed '&view=...' or similar suffixes."""
     if not path:
@@ -455,5 +738,5 @@ def _strip_view_suffix(path: str) -> str:
         cleaned_segments.append(segment)
     cleaned_path = "/".join(cleaned_segments)
     # Collapse potential repeated slashes introduced by stripping.
-    cleaned_path = re.sub(r"/{2,}", "/", cleaned_path)
+    cleaned_path = _RE_MULTISLASH.sub("/", cleaned_path)
     return cleaned_path.rstrip("/") if cleaned_path.endswith("/") and len(cleaned_path) > 1 else cleaned_path
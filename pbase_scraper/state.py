@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Set
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = ".pbase_state.sqlite"
+
+
+class ScrapeState:
+    """SQLite-backed record of finished downloads so interrupted runs can resume."""
+
+    def __init__(self, output_dir: Path, *, batch_size: int = 50) -> None:
+        self.path = output_dir / STATE_FILENAME
+        self.batch_size = batch_size
+        # Writes come from image worker threads; the lock serializes them on one connection.
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS visited_image (url TEXT PRIMARY KEY)")
+        self._conn.commit()
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+
+    def load_images(self) -> Set[str]:
+        """Return image page URLs completed by earlier runs."""
+        rows = self._conn.execute("SELECT url FROM visited_image").fetchall()
+        if rows:
+            logger.info("Resuming with %d previously downloaded images", len(rows))
+        return {row[0] for row in rows}
+
+    def add_image(self, url: str) -> None:
+        with self._lock:
+            self._pending.append(url)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO visited_image (url) VALUES (?)",
+            [(url,) for url in self._pending],
+        )
+        self._conn.commit()
+        self._pending.clear()